@@ -2,3284 +2,357 @@
 # coding: utf-8
 
 # # SJR Quartile Extraction and Merging (1999–2024)
-This script reads three SJR files for the years 1999–2024 (Computer Science, Psychology, and Business), extracts the journal name and quartile (Q1–Q4) (and rank, if available), merges them into a single dataset, standardizes journal names to correctly identify duplicates, keeps the quartile information for each journal, and finally saves the sorted output to an Excel file.
+# This script reads three SJR files for the years 1999–2024 (Computer Science, Psychology, and Business), extracts the journal name and quartile (Q1–Q4) (and rank, if available), merges them into a single dataset, standardizes journal names to correctly identify duplicates, keeps the quartile information for each journal, and finally saves the sorted output to an Excel file.
 # In[ ]:
 
 
+import numpy as np
 import pandas as pd
 import re
 import csv
-from io import StringIO
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import reduce
+from io import BytesIO
+from itertools import chain
 from pathlib import Path
 
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 1999  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 1999  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 1999  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR1999_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2000  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2000  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2000  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2000_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2001  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2001  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2001  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2001_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2002  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2002  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2002  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2002_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2003  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2003  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2003  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2003_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2004  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2004  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2004  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2004_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2005  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2005  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2005  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2005_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2006  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2006  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2006  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2006_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2007  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2007  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2007  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2007_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2008  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2008  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2008  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2008_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2009  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2009  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2009  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2009_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2010  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2010  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2010  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2010_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2011  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2011  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2011  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2011_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2012  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2012  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2012  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2012_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2013  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2013  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2013  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2013_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2014  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2014  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2014  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2014_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2015  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2015  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2015  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2015_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2016  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2016  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2016  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2016_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2017  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2017  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2017  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2017_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
+import openpyxl
 
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
+try:
+    import xlsxwriter
+    XLSX_WRITER = "xlsxwriter"
+except ImportError:
+    XLSX_WRITER = "openpyxl"
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
+# contiguous Arrow strings hash and sort in C; plain objects otherwise
+TEXT_DTYPE = "string[pyarrow]" if HAS_PYARROW else object
 
 # ================= 1) PATH =================
 BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2018  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2018  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2018  Subject Area - Business, Management and Accounting.xlsx",
+CACHE_DIR = BASE_DIR / ".cache"
+CACHE_VERSION = 3  # bump when load_scimago's output schema changes
+
+YEARS = range(1999, 2025)
+SUBJECT_AREAS = [
+    "Computer Science",
+    "Psychology",
+    "Business, Management and Accounting",
 ]
-
-OUT_XLSX = BASE_DIR / "SJR2018_QRank.xlsx"
+SJR_FILE_TEMPLATE = "scimagojr {year}  Subject Area - {subject}.xlsx"
+QRANK_XLSX = BASE_DIR / "SJR_ALL_QRank.xlsx"
 
 Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
 
 # ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
+# one regex pass blanks "the" and non-alphanumerics; "&" and apostrophes are left
+# for the translate table, which expands/deletes them in a single C-level pass
+_CLEAN_RE = re.compile(r"\bthe\b|[^a-z0-9\s&’'`]")
+_WS_RE = re.compile(r"\s+")
+_TITLE_TABLE = str.maketrans({"&": " and ", "’": None, "'": None, "`": None})
+
+def norm_titles(titles: pd.Series) -> pd.Series:
+    # a journal repeats across subject files, so clean each distinct title once and map back
+    codes, uniques = pd.factorize(titles.fillna("").astype(str))
+
+    # object dtype keeps Python's str.lower() (Arrow lowercases "İ" differently)
+    s = pd.Series(uniques, dtype=object).str.lower()
+    s = s.str.replace(_CLEAN_RE, " ", regex=True)
+    s = s.str.translate(_TITLE_TABLE)
+    s = s.str.replace(_WS_RE, " ", regex=True).str.strip()
+    return pd.Series(s.to_numpy()[codes], index=titles.index, dtype=object)
+
+def pick_cols(columns) -> tuple:
+    # case-insensitive lookup of the Title / Quartile / Rank columns (None when absent)
+    cols = {str(c).lower().strip(): c for c in columns}
     q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
+    return cols.get("title"), q_col, cols.get("rank")
 
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2019  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2019  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2019  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2019_QRank.xlsx"
+def is_semicolon_header(header) -> bool:
+    # SJR CSV export saved as .xlsx: each row is semicolon-separated text, no Title cell
+    return "title" not in {str(c).lower().strip() for c in header} and ";" in str(header[0])
 
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
+def parse_semicolon_lines(lines) -> pd.DataFrame:
+    lines = iter(lines)
+    first = next(lines, None)
 
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
+    if first is None:
         raise ValueError("Empty file")
 
-    header = rows[0]
-    data = rows[1:]
+    header = next(csv.reader([first], delimiter=";", quotechar='"'))
+    lines = list(lines)
+
+    if HAS_PYARROW:
+        # Arrow's CSV reader parses in C++ straight into column buffers; every column stays text
+        body = "\n".join(lines).encode("utf-8")
+        if not body:
+            return pd.DataFrame(columns=header)
+
+        try:
+            tbl = pacsv.read_csv(
+                BytesIO(body),
+                read_options=pacsv.ReadOptions(column_names=header),
+                parse_options=pacsv.ParseOptions(delimiter=";", quote_char='"'),
+                convert_options=pacsv.ConvertOptions(column_types={c: pa.string() for c in header}),
+            )
+            return tbl.to_pandas()
+        except pa.ArrowInvalid:
+            # rows with missing trailing cells: csv.reader below pads them instead of failing
+            pass
+
+    data = list(csv.reader(lines, delimiter=";", quotechar='"'))
     return pd.DataFrame(data, columns=header)
 
-def load_scimago(path: Path) -> pd.DataFrame:
+def join_row_cells(raw: pd.DataFrame) -> list:
+    cells = raw.fillna("").astype(str).to_numpy(dtype=str)
+    # to_numpy may return a read-only view (e.g. a single-column sheet), so don't assign in place
+    cells = np.where(cells == "nan", "", cells)
+
+    # join cells column by column, so the loop runs per column instead of per row
+    if not cells.size:
+        return []
+    joined = reduce(np.char.add, cells.T)
+    return joined[joined != ""].tolist()
+
+def is_zip_file(path: Path) -> bool:
+    # a real .xlsx is a ZIP container; SJR CSV downloads renamed to .xlsx are plain text
+    with open(path, "rb") as f:
+        return f.read(2) == b"PK"
+
+def read_sheet(path: Path) -> pd.DataFrame:
+    if not is_zip_file(path):
+        # C CSV parser, no XML layer at all
+        return pd.read_csv(path, sep=";", quotechar='"', dtype=str, keep_default_na=False)
+
+    # the workbook is read once; the first row decides how to parse it
+    if EXCEL_ENGINE == "calamine":
+        raw = pd.read_excel(path, header=None, dtype=str, engine="calamine")
+        if raw.empty:
+            raise ValueError(f"Empty file: {path.name}")
+
+        header = raw.iloc[0].tolist()
+        if is_semicolon_header(header):
+            return parse_semicolon_lines(join_row_cells(raw))
+        return raw.iloc[1:].set_axis(header, axis=1).reset_index(drop=True)
+
+    # without calamine, stream the sheet in read-only mode
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
     try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2020  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2020  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2020  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2020_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError(f"Empty file: {path.name}")
+
+        if is_semicolon_header(header):
+            # join each row's cells and feed the lines straight to csv.reader,
+            # without building an intermediate DataFrame
+            lines = ("".join(str(c) for c in r if c is not None) for r in chain([header], rows))
+            return parse_semicolon_lines(line for line in lines if line)
+
+        # only Title / Quartile / Rank are used, so don't build the other ~20 columns
+        keep = sorted(header.index(c) for c in pick_cols(header) if c is not None)
+        if not keep:
+            return pd.DataFrame(rows, columns=header)
+
+        picked = ([r[i] if i < len(r) else None for i in keep] for r in rows)
+        return pd.DataFrame(picked, columns=[header[i] for i in keep])
+    finally:
+        wb.close()
 
 def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
+    df = read_sheet(path)
 
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2022  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2022  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2022  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2022_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
+    title_col, q_col, rank_col = pick_cols(df.columns)
 
     if not title_col or not q_col:
         raise ValueError(f"Title / Quartile not found in {path.name}")
 
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
+    # fixed schema: files without a Rank column get an all-NaN SJR_Rank.
+    # The rank is coerced once per file, on the small frame, instead of after the concat.
+    out = pd.DataFrame({
+        "Title": df[title_col].to_numpy(),
+        "Quartile": df[q_col].to_numpy(),
+        "SJR_Rank": pd.to_numeric(df[rank_col], errors="coerce").to_numpy() if rank_col else np.nan,
+    })
 
     return out
 
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
-
-
-
-# In[ ]:
-
-
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
-SJR_FILES = [
-    BASE_DIR / "scimagojr 2023  Subject Area - Computer Science.xlsx",
-    BASE_DIR / "scimagojr 2023  Subject Area - Psychology.xlsx",
-    BASE_DIR / "scimagojr 2023  Subject Area - Business, Management and Accounting.xlsx",
-]
-
-OUT_XLSX = BASE_DIR / "SJR2023_QRank.xlsx"
-
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
+def load_scimago_cached(path: Path) -> pd.DataFrame:
+    # parsed files are kept as Parquet, keyed by mtime + size, so unchanged inputs skip Excel
+    if not HAS_PYARROW:
+        return load_scimago(path)
 
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
+    st = path.stat()
+    cache_path = CACHE_DIR / f"{path.stem}.{st.st_mtime_ns}.{st.st_size}.v{CACHE_VERSION}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
 
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
+    out = load_scimago(path).astype({"Title": "string", "Quartile": "string"})
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-def load_scimago(path: Path) -> pd.DataFrame:
+    # write to a temp file and rename, so an interrupted run never leaves a truncated cache entry
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    os.close(fd)
     try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
+        out.to_parquet(tmp, compression="zstd")
+        os.replace(tmp, cache_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+    # drop this file's entries for older mtimes / sizes / schema versions
+    stale = re.compile(re.escape(path.stem) + r"\.\d+\.\d+\.v\d+\.parquet")
+    for old in CACHE_DIR.iterdir():
+        if old != cache_path and stale.fullmatch(old.name):
+            old.unlink(missing_ok=True)
 
     return out
 
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
+@contextmanager
+def open_xlsx(path: Path):
+    # one workbook container shared by every sheet written inside the block
+    if XLSX_WRITER == "xlsxwriter":
+        wb = xlsxwriter.Workbook(str(path), {
+            "constant_memory": True,
+            # write titles verbatim: no auto-hyperlinks or formulas from cell text
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+        })
+        try:
+            yield wb
+        finally:
+            wb.close()
+    else:
+        with pd.ExcelWriter(path, engine=XLSX_WRITER) as writer:
+            yield writer
+
+def write_sheet(book, df: pd.DataFrame, sheet_name: str) -> None:
+    if XLSX_WRITER != "xlsxwriter":
+        df.to_excel(book, sheet_name=sheet_name, index=False)
+        return
+
+    # constant_memory flushes each row once written, but pandas writes column by column
+    # (later columns would be dropped), so stream the rows to xlsxwriter directly
+    rows = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+    ws = book.add_worksheet(sheet_name)
+    header_fmt = book.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    ws.write_row(0, 0, [str(c) for c in df.columns], header_fmt)
+    for i, row in enumerate(rows, start=1):
+        ws.write_row(i, 0, row)
+
+def write_xlsx(df: pd.DataFrame, path: Path) -> None:
+    with open_xlsx(path) as book:
+        write_sheet(book, df, "Sheet1")
+
+# ================= 3) PIPELINE =================
+def build_qrank(sjr_files: list, label: str = "") -> pd.DataFrame:
+    # years are built in parallel, so every log line carries its label (the year)
+    tag = f"[{label}] " if label else ""
+
+    # ---- load files ----
+    print(f"{tag}📂 Reading ONLY these files:", ", ".join(f.name for f in sjr_files))
+
+    # the files are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=len(sjr_files)) as ex:
+        parts = list(ex.map(load_scimago_cached, sjr_files))
+
+    for f, df in zip(sjr_files, parts):
+        print(f"{tag}✅ Loaded:", f.name, "| rows:", len(df))
+
+    sjr = pd.concat(parts, ignore_index=True)
+    # one category per input file instead of repeating the file name on every row
+    sjr["Source_File"] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(parts)), [len(df) for df in parts]),
+        categories=[f.name for f in sjr_files],
+    )
+    sjr["Title"] = sjr["Title"].astype(TEXT_DTYPE)
+
+    # ---- clean + rank ----
+    # 4-value column: categorical codes instead of object strings. One hash lookup gives
+    # code -1 for anything outside Q1-Q4, so it yields both the filter and the int8 rank.
+    # The raw column only has a few distinct spellings, so the quote/space clean-up runs on
+    # those; the extra last slot maps missing values (factorize code -1) to -1 as well.
+    q_codes, q_uniques = pd.factorize(sjr["Quartile"])
+    quartile = pd.Index(q_uniques).astype(str).str.replace('"', "").str.strip()
+    codes = np.append(pd.Index(list(Q_ORDER)).get_indexer(quartile), -1)[q_codes]
+    keep = codes >= 0
+
+    # filter and add the derived columns in one step instead of copy() + setitem per column
+    sjr = sjr.loc[keep].assign(
+        Quartile=pd.Categorical.from_codes(codes[keep], categories=list(Q_ORDER), ordered=True),
+        Q_Rank=(codes[keep] + 1).astype(np.int8),
+        Title_Clean=lambda d: norm_titles(d["Title"]).astype(TEXT_DTYPE),
+        SJR_Rank_num=lambda d: d["SJR_Rank"],
+    )
 
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
+    # keep best quartile per journal: lowest Q_Rank, then lowest SJR rank (missing ranks last).
+    # One hashed groupby pass instead of sorting the whole frame.
+    best_key = sjr["Q_Rank"] * 1e12 + sjr["SJR_Rank_num"].fillna(1e11)
 
-sjr = pd.concat(parts, ignore_index=True)
+    sjr = sjr.loc[best_key.groupby(sjr["Title_Clean"], sort=False).idxmin()]
 
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
+    # ---- final sort ----
+    final_sort = ["Q_Rank", "SJR_Rank_num", "Title"]
 
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
+    sjr_sorted = sjr.sort_values(final_sort, kind="stable", ignore_index=True)
 
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
+    counts = sjr_sorted["Quartile"].value_counts(sort=False)
+    print(f"{tag}✅ DONE | Rows:", len(sjr_sorted), "| Quartile counts:",
+          ", ".join(f"{q}: {n}" for q, n in counts.items()))
 
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
+    return sjr_sorted
 
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
+def process_year(year: int):
+    sjr_files = [BASE_DIR / SJR_FILE_TEMPLATE.format(year=year, subject=s) for s in SUBJECT_AREAS]
+    missing = [f.name for f in sjr_files if not f.exists()]
+    if len(missing) == len(sjr_files):
+        print(f"[{year}] ⏭️ skipped, no SJR files for this year")
+        return None
+    if missing:
+        # a partial year is almost always a misnamed file; don't silently drop its sheet
+        raise FileNotFoundError(f"❌ {year}: missing {missing}")
 
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
+    return build_qrank(sjr_files, label=str(year))
 
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
+# ================= 4) RUN ALL YEARS =================
+# years are independent: build them in worker processes and write the sheets here in year order.
+# "fork" lets the workers use the functions defined in this notebook, but it is only safe on
+# Linux (macOS defaults to spawn for a reason); elsewhere the years run one after another.
+if sys.platform.startswith("linux"):
+    year_pool = ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1), mp_context=mp.get_context("fork"))
+else:
+    year_pool = ThreadPoolExecutor(max_workers=1)
 
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
+# one workbook with a sheet per year instead of 26 separate .xlsx containers
+with year_pool, open_xlsx(QRANK_XLSX) as book:
+    for year, sjr_sorted in zip(YEARS, year_pool.map(process_year, YEARS)):
+        if sjr_sorted is not None:
+            write_sheet(book, sjr_sorted, str(year))
 
-print("—" * 50)
-print("✅ DONE")
-print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
+print("Saved to:", QRANK_XLSX)
 
 
 # In[ ]:
 
 
-import pandas as pd
-import re
-import csv
-from io import StringIO
-from pathlib import Path
-
-# ================= 1) PATH =================
-BASE_DIR = Path("xxxx")
-
+# Same pipeline for the subject-area files without a year (uses the helpers above)
 SJR_FILES = [
     BASE_DIR / "Business, Management and Accounting.xlsx",
     BASE_DIR / "Psychology.xlsx",
@@ -3288,120 +361,8 @@ SJR_FILES = [
 
 OUT_XLSX = BASE_DIR / "SJR__ONLY_3FILES_SORTED_with_QRank.xlsx"
 
-Q_ORDER = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-# ================= 2) UTILITIES =================
-def norm_title(x):
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def parse_semicolon_xlsx(path: Path) -> pd.DataFrame:
-    raw = pd.read_excel(path, header=None, dtype=str)
-    lines = []
-    for _, row in raw.iterrows():
-        parts = [str(x) for x in row.tolist() if x not in [None, "nan"]]
-        if parts:
-            lines.append("".join(parts))
-
-    reader = csv.reader(StringIO("\n".join(lines)), delimiter=";", quotechar='"')
-    rows = list(reader)
-
-    if not rows:
-        raise ValueError("Empty file")
-
-    header = rows[0]
-    data = rows[1:]
-    return pd.DataFrame(data, columns=header)
-
-def load_scimago(path: Path) -> pd.DataFrame:
-    try:
-        df = pd.read_excel(path)
-        cols = {str(c).lower().strip(): c for c in df.columns}
-        title_col = cols.get("title")
-        q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-        rank_col = cols.get("rank")
-
-        if title_col and q_col:
-            out = df[[title_col, q_col]].copy()
-            out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-            if rank_col:
-                out["SJR_Rank"] = df[rank_col]
-            return out
-    except Exception:
-        pass
-
-    df = parse_semicolon_xlsx(path)
-    cols = {str(c).lower().strip(): c for c in df.columns}
-
-    title_col = cols.get("title")
-    q_col = cols.get("sjr best quartile") or cols.get("best quartile") or cols.get("quartile")
-    rank_col = cols.get("rank")
-
-    if not title_col or not q_col:
-        raise ValueError(f"Title / Quartile not found in {path.name}")
-
-    out = df[[title_col, q_col]].copy()
-    out.rename(columns={title_col: "Title", q_col: "Quartile"}, inplace=True)
-    if rank_col:
-        out["SJR_Rank"] = df[rank_col]
-
-    return out
-
-# ================= 3) LOAD FILES =================
-print("📂 Reading ONLY these files:")
-for f in SJR_FILES:
-    print(" -", f.name)
-
-parts = []
-for f in SJR_FILES:
-    df = load_scimago(f)
-    df["Source_File"] = f.name
-    parts.append(df)
-    print("✅ Loaded:", f.name, "| rows:", len(df))
-
-sjr = pd.concat(parts, ignore_index=True)
-
-# ================= 4) CLEAN + RANK =================
-sjr["Quartile"] = sjr["Quartile"].astype(str).str.replace('"', "").str.strip()
-sjr = sjr[sjr["Quartile"].isin(Q_ORDER)].copy()
-
-sjr["Q_Rank"] = sjr["Quartile"].map(Q_ORDER).astype(int)
-sjr["Title_Clean"] = sjr["Title"].apply(norm_title)
-
-if "SJR_Rank" in sjr.columns:
-    sjr["SJR_Rank_num"] = pd.to_numeric(sjr["SJR_Rank"], errors="coerce")
-
-# keep best quartile per journal
-sort_cols = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    sort_cols.append("SJR_Rank_num")
-
-sjr = sjr.sort_values(sort_cols).drop_duplicates("Title_Clean", keep="first")
-
-# ================= 5) FINAL SORT =================
-final_sort = ["Q_Rank"]
-if "SJR_Rank_num" in sjr.columns:
-    final_sort.append("SJR_Rank_num")
-final_sort.append("Title")
-
-sjr_sorted = sjr.sort_values(final_sort).reset_index(drop=True)
-
-# ================= 6) SAVE =================
-sjr_sorted.to_excel(OUT_XLSX, index=False)
-
-print("—" * 50)
-print("✅ DONE")
+write_xlsx(build_qrank(SJR_FILES), OUT_XLSX)
 print("Saved to:", OUT_XLSX)
-print("Rows:", len(sjr_sorted))
-print("Quartile counts:")
-print(sjr_sorted["Quartile"].value_counts())
 
 
 # In[ ]:
@@ -3411,6 +372,13 @@ import pandas as pd
 import re
 from pathlib import Path
 
+# xlsxwriter writes much faster than openpyxl; openpyxl is the fallback
+try:
+    import xlsxwriter  # noqa: F401
+    XLSX_WRITER = "xlsxwriter"
+except ImportError:
+    XLSX_WRITER = "openpyxl"
+
 # ================= 1) PATHS =================
 print("START RUNNING...")
 
@@ -3426,17 +394,22 @@ OUT_PATH = MERGED_PATH.parent / "xxx"
 NEW_COL = "Quartile_Matched"
 
 # ================= 2) HELPERS =================
-def norm_title(x):
-    """Normalize journal titles for matching."""
-    if pd.isna(x):
-        return ""
-    s = str(x).lower()
-    s = s.replace("&", " and ")
-    s = re.sub(r"\bthe\b", " ", s)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+# one pass drops "the" and punctuation; "&" and apostrophes go through the translate table
+_CLEAN_RE = re.compile(r"\bthe\b|[^a-z0-9\s&’'`]")
+_WS_RE = re.compile(r"\s+")
+_TITLE_TABLE = str.maketrans({"&": " and ", "’": None, "'": None, "`": None})
+
+def norm_titles(titles: pd.Series) -> pd.Series:
+    """Normalize journal titles for matching (same rules as Title_Clean in the SJR file)."""
+    # each distinct title is cleaned once, then mapped back to the rows
+    codes, uniques = pd.factorize(titles.fillna("").astype(str))
+
+    # object dtype keeps Python's str.lower() (Arrow lowercases "İ" differently)
+    s = pd.Series(uniques, dtype=object).str.lower()
+    s = s.str.replace(_CLEAN_RE, " ", regex=True)
+    s = s.str.translate(_TITLE_TABLE)
+    s = s.str.replace(_WS_RE, " ", regex=True).str.strip()
+    return pd.Series(s.to_numpy()[codes], index=titles.index, dtype=object)
 
 def find_journal_column(columns):
     """
@@ -3483,7 +456,7 @@ xf = pd.ExcelFile(MERGED_PATH)
 if SHEET_NAME not in xf.sheet_names:
     raise ValueError(f"❌ Sheet '{SHEET_NAME}' not found. موجودها: {xf.sheet_names}")
 
-df = pd.read_excel(MERGED_PATH, sheet_name=SHEET_NAME)
+df = xf.parse(SHEET_NAME)
 
 # Detect journal column
 journal_col = find_journal_column(df.columns)
@@ -3495,7 +468,7 @@ if not journal_col:
     )
 
 # ================= 6) MATCH QUARTILE =================
-df["_journal_clean"] = df[journal_col].apply(norm_title)
+df["_journal_clean"] = norm_titles(df[journal_col])
 
 # Map quartile; if not found => NOT FOUND
 df[NEW_COL] = df["_journal_clean"].map(q_map).fillna("NOT FOUND")
@@ -3508,12 +481,18 @@ df[NEW_COL] = df["_journal_clean"].map(q_map).fillna("NOT FOUND")
 df.drop(columns=["_journal_clean"], inplace=True)
 
 # ================= 7) SAVE (COPY ALL SHEETS) =================
-with pd.ExcelWriter(OUT_PATH, engine="openpyxl") as writer:
+# no constant_memory here: to_excel writes column by column, which that mode cannot take
+# keep cell text as-is: xlsxwriter would otherwise turn URLs into links and "=..." into formulas
+writer_kwargs = (
+    {"engine_kwargs": {"options": {"strings_to_urls": False, "strings_to_formulas": False}}}
+    if XLSX_WRITER == "xlsxwriter" else {}
+)
+with pd.ExcelWriter(OUT_PATH, engine=XLSX_WRITER, **writer_kwargs) as writer:
     for sh in xf.sheet_names:
         if sh == SHEET_NAME:
             df.to_excel(writer, sheet_name=sh, index=False)
         else:
-            pd.read_excel(MERGED_PATH, sheet_name=sh).to_excel(writer, sheet_name=sh, index=False)
+            xf.parse(sh).to_excel(writer, sheet_name=sh, index=False)
 
 # ================= 8) SUMMARY =================
 matched = (df[NEW_COL] != "NOT FOUND").sum()
@@ -3543,15 +522,17 @@ print(f"TOTAL ROWS: {len(df)}")
 
 # # Year-Based SJR Quartile Matching and Update
 
-# This script opens the main Excel file second filter.xlsx (sheet: rank filter) and reads the year and journal name from each row. For every year between 1999 and 2023, it locates the corresponding SJR file (SJR{year}_QRank.xlsx) in the 1999–2023 folder. Journal names are normalized (lowercased and spacing standardized) to ensure accurate matching. The script then matches each journal to its quartile (Q1–Q4) from the SJR file of the same year and writes the result into a new column called Quartile_Matched in the main Excel file. Finally, it updates (replaces) the rank filter sheet in the original Excel file.
+# This script opens the main Excel file second filter.xlsx (sheet: rank filter) and reads the year and journal name from each row. For every year between 1999 and 2023, it locates the corresponding SJR sheet (sheet "{year}" of SJR_ALL_QRank.xlsx, or the older per-year file SJR{year}_QRank.xlsx) in the 1999–2023 folder. Journal names are normalized (lowercased and spacing standardized) to ensure accurate matching. The script then matches each journal to its quartile (Q1–Q4) from the SJR file of the same year and writes the result into a new column called Quartile_Matched in the main Excel file. Finally, it updates (replaces) the rank filter sheet in the original Excel file.
 # 
-# In short, if a row has year = 2007, the quartile is taken only from SJR2007_QRank.xlsx, not from any other year.
+# In short, if a row has year = 2007, the quartile is taken only from the 2007 SJR sheet, not from any other year.
 
 # In[ ]:
 
 
+import numpy as np
 import pandas as pd
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ================= Paths =================
@@ -3559,6 +540,8 @@ SECOND_FILTER = Path("xxx")
 SHEET_NAME = "rank filter"
 
 SJR_DIR = Path("xxx")
+# combined output of the first cell (one sheet per year); per-year files are the fallback
+SJR_BOOK = SJR_DIR / "SJR_ALL_QRank.xlsx"
 
 # ================= Columns in SECOND FILTER =================
 YEAR_COL = "year"
@@ -3570,12 +553,12 @@ SJR_TITLE_COL = "Title"
 SJR_QUARTILE_COL = "Quartile"
 
 # ================= Helpers =================
-def norm_journal(x) -> str:
-    if pd.isna(x):
-        return ""
-    s = str(x).strip().lower()
-    s = re.sub(r"\s+", " ", s)  # collapse multiple spaces
-    return s
+_WS_RE = re.compile(r"\s+")
+
+def norm_journals(s: pd.Series) -> pd.Series:
+    # object dtype keeps Python's str.lower(), same keys as the old per-row version
+    s = s.fillna("").astype(str).astype(object).str.strip().str.lower()
+    return s.str.replace(_WS_RE, " ", regex=True)  # collapse multiple spaces
 
 def find_col(df: pd.DataFrame, target: str) -> str:
     """Find a column name case-insensitively."""
@@ -3596,31 +579,56 @@ if OUT_COL not in df.columns:
     df[OUT_COL] = pd.NA
 
 # normalize journals once
-df["_jnorm"] = df[JOURNAL_COL_REAL].map(norm_journal)
+df["_jnorm"] = norm_journals(df[JOURNAL_COL_REAL])
 
-# year to int (Excel sometimes reads as float)
-df["_year_int"] = pd.to_numeric(df[YEAR_COL_REAL], errors="coerce").astype("Int64")
+# year to int (Excel sometimes reads as float); plain int32 with -1 for missing or
+# non-integer years keeps the year mask and the merge key in numpy
+year_num = pd.to_numeric(df[YEAR_COL_REAL], errors="coerce").to_numpy(dtype=float)
+df["_year_int"] = np.where(year_num % 1 == 0, year_num, -1).astype(np.int32)
 
 # ================= Year-wise matching =================
-for year in range(1999, 2024):
-    mask = df["_year_int"] == year
-    if not mask.any():
-        continue
-
-    sjr_file = SJR_DIR / f"SJR{year}_QRank.xlsx"
-    if not sjr_file.exists():
-        continue
+sjr_book = pd.ExcelFile(SJR_BOOK) if SJR_BOOK.exists() else None
 
-    sjr_df = pd.read_excel(sjr_file)
+def sjr_year_file(year: int) -> Path:
+    return SJR_DIR / f"SJR{year}_QRank.xlsx"
 
+def sjr_lookup_frame(year: int, sjr_df: pd.DataFrame) -> pd.DataFrame:
+    """Normalized title -> quartile rows of one year's SJR sheet."""
     # enforce SJR columns (case-insensitive)
     sjr_title_col = find_col(sjr_df, SJR_TITLE_COL)
     sjr_quart_col = find_col(sjr_df, SJR_QUARTILE_COL)
 
-    sjr_df["_jnorm"] = sjr_df[sjr_title_col].map(norm_journal)
-    sjr_map = dict(zip(sjr_df["_jnorm"], sjr_df[sjr_quart_col]))
+    return pd.DataFrame({
+        "_year_int": year,
+        "_jnorm": norm_journals(sjr_df[sjr_title_col]),
+        "_quartile": sjr_df[sjr_quart_col],
+    })
+
+present = set(np.unique(df["_year_int"]).tolist())
+years = [year for year in range(1999, 2024) if year in present]
+
+# sheets of the combined book in one parse call; the workbook object is not shared across threads
+book_years = [year for year in years if sjr_book is not None and str(year) in sjr_book.sheet_names]
+sjr_sheets = {int(sh): d for sh, d in sjr_book.parse([str(y) for y in book_years]).items()} if book_years else {}
+
+# older per-year files are independent reads, so load them concurrently
+file_years = [year for year in years if year not in sjr_sheets and sjr_year_file(year).exists()]
+with ThreadPoolExecutor(max_workers=8) as ex:
+    sjr_sheets.update(zip(file_years, ex.map(lambda y: pd.read_excel(sjr_year_file(y)), file_years)))
+
+sjr_years = {year: sjr_lookup_frame(year, sjr_sheets[year]) for year in years if year in sjr_sheets}
+
+if sjr_years:
+    # one (year, title) hash join instead of a mask + map per year;
+    # within a year the last duplicate title wins, as the per-year dict did
+    sjr_all = pd.concat(sjr_years.values(), ignore_index=True).astype({"_year_int": np.int32})
+    sjr_all = sjr_all.drop_duplicates(["_year_int", "_jnorm"], keep="last")
+
+    matched = df[["_year_int", "_jnorm"]].merge(sjr_all, on=["_year_int", "_jnorm"], how="left", validate="m:1")
 
-    df.loc[mask, OUT_COL] = df.loc[mask, "_jnorm"].map(sjr_map)
+    # only rows whose year has an SJR sheet are (over)written
+    has_sjr = np.isin(df["_year_int"].to_numpy(), list(sjr_years))
+    df.loc[has_sjr, OUT_COL] = matched["_quartile"].to_numpy()[has_sjr]
 
 # ================= Cleanup + Save =================
 df.drop(columns=["_jnorm", "_year_int"], inplace=True, errors="ignore")